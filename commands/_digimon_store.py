@@ -0,0 +1,133 @@
+"""Shared loader for the JSON files in data/digimon.
+
+Both the /digimon and /digievo cogs read the same files, so the parsed
+data is cached here at module level. Each cached entry remembers the
+file's mtime; if the file changes on disk the next lookup reparses it.
+"""
+
+import bisect
+import json
+import os
+
+try:
+    # orjson parses severalfold faster than the stdlib; its
+    # JSONDecodeError subclasses json.JSONDecodeError, so callers'
+    # except clauses keep working either way.
+    import orjson as _json
+except ImportError:
+    import json as _json
+
+from discord import app_commands
+
+DIGIMON_DIR = "data/digimon"
+
+# name (lowercase) -> (mtime, parsed data)
+_DIGIMON_CACHE: dict[str, tuple[float, dict]] = {}
+
+# Cached directory listing for the autocompletes. The directory mtime
+# changes whenever a file is added or removed, so it doubles as the
+# invalidation key.
+_NAMES_CACHE: dict = {
+    "mtime": None,
+    "names": [],
+    "sorted_lower": [],
+    "empty_choices": None,
+}
+
+
+def get_names() -> list[str]:
+    """
+    Returns the sorted list of known digimon names (file stems), cached
+    until the data directory changes.
+    """
+    st = os.stat(DIGIMON_DIR)
+    if st.st_mtime != _NAMES_CACHE["mtime"]:
+        _NAMES_CACHE["names"] = sorted(
+            f[:-5] for f in os.listdir(DIGIMON_DIR)
+            if f.lower().endswith(".json")
+        )
+        _NAMES_CACHE["sorted_lower"] = sorted(
+            n.lower() for n in _NAMES_CACHE["names"]
+        )
+        _NAMES_CACHE["empty_choices"] = None
+        _NAMES_CACHE["mtime"] = st.st_mtime
+    return _NAMES_CACHE["names"]
+
+
+def get_empty_choices() -> tuple:
+    """
+    Returns the Choice objects for an empty autocomplete query (the
+    first 25 names). Opening the dropdown is the most common
+    autocomplete state, so these are built once per cache generation.
+    """
+    get_names()
+    if _NAMES_CACHE["empty_choices"] is None:
+        _NAMES_CACHE["empty_choices"] = tuple(
+            app_commands.Choice(name=n.capitalize(), value=n)
+            for n in _NAMES_CACHE["sorted_lower"][:25]
+        )
+    return _NAMES_CACHE["empty_choices"]
+
+
+def search_names(current: str, limit: int = 25) -> list[str]:
+    """
+    Returns up to `limit` lowercase names matching `current`. Prefix
+    matches are found with bisect on the pre-lowercased sorted list;
+    substring matches only fill the remaining slots if the prefix scan
+    came up short.
+    """
+    get_names()
+    sorted_lower = _NAMES_CACHE["sorted_lower"]
+    q = current.lower()
+    if not q:
+        return sorted_lower[:limit]
+
+    lo = bisect.bisect_left(sorted_lower, q)
+    hi = bisect.bisect_left(sorted_lower, q + "\uffff", lo)
+    hits = sorted_lower[lo:min(hi, lo + limit)]
+    if len(hits) < limit:
+        prefix_hits = set(hits)
+        for dn in sorted_lower:
+            if q in dn and dn not in prefix_hits:
+                hits.append(dn)
+                if len(hits) >= limit:
+                    break
+    return hits
+
+
+def load_digimon(name: str) -> dict:
+    """
+    Returns the parsed JSON data for `name` (already lowercased).
+
+    Raises FileNotFoundError if there is no file for that name, and
+    json.JSONDecodeError if the file exists but isn't valid JSON.
+    """
+    path = f"{DIGIMON_DIR}/{name}.json"
+    st = os.stat(path)
+    cached = _DIGIMON_CACHE.get(name)
+    if cached is not None and cached[0] == st.st_mtime:
+        return cached[1]
+
+    with open(path, "rb") as f:
+        data = _json.loads(f.read())
+    _DIGIMON_CACHE[name] = (st.st_mtime, data)
+    return data
+
+
+def preload_all() -> None:
+    """
+    Parses every digimon file into the cache in one pass. Called from the
+    cog setups so slash commands never pay the cold-cache parse; safe to
+    call more than once (warm entries just revalidate their mtime).
+    """
+    try:
+        names = get_names()
+    except FileNotFoundError:
+        return
+    for name in names:
+        try:
+            load_digimon(name.lower())
+        except (OSError, json.JSONDecodeError):
+            # A broken file shouldn't stop the bot from starting; the
+            # command itself reports the error when that name is asked for.
+            continue
@@ -1,21 +1,42 @@
 import discord
 from discord.ext import commands
 from discord import app_commands, ui
+import asyncio
 import json
-import os
 
-def bullet_scale(value: int, max_value: int) -> str:
-    """
-    Returns a string like '⬤⬤⬤⭘⭘⭘ `3/6`' to represent current vs max.
-    Example: bullet_scale(3, 6) -> '⬤⬤⬤⭘⭘⭘ `3/6`'
-    """
+from commands import _digimon_store
+
+_BULLETS = "⬤" * 12
+_EMPTIES = "⭘" * 12
+
+# Stats are small bounded ints, so every sensible (value, max) pair can
+# be rendered once at import time instead of on every /digimon call.
+_BULLET_CACHE = {
+    (v, m): f"{_BULLETS[:v]}{_EMPTIES[:m - v]} `{v}/{m}`"
+    for m in range(1, 11)
+    for v in range(0, m + 1)
+}
+
+
+def _slow_bullet(value: int, max_value: int) -> str:
     if max_value < 1:
         max_value = max(value, 1)
+    if 0 <= value <= 12 and 0 <= max_value - value <= 12:
+        # Slicing the constant strings skips the repeat-multiply allocation
+        return f"{_BULLETS[:value]}{_EMPTIES[:max_value - value]} `{value}/{max_value}`"
     filled = "⬤" * value
     empty = "⭘" * (max_value - value)
     return f"{filled}{empty} `{value}/{max_value}`"
 
 
+def bullet_scale(value: int, max_value: int) -> str:
+    """
+    Returns a string like '⬤⬤⬤⭘⭘⭘ `3/6`' to represent current vs max.
+    Example: bullet_scale(3, 6) -> '⬤⬤⬤⭘⭘⭘ `3/6`'
+    """
+    return _BULLET_CACHE.get((value, max_value)) or _slow_bullet(value, max_value)
+
+
 def build_info_message(data: dict) -> str:
     """
     Builds the Digimon info message, including evolution details.
@@ -32,26 +53,21 @@ def build_info_message(data: dict) -> str:
     ins_str = bullet_scale(data.get("insight", 0), data.get("insight_max", data.get("insight", 0)))
 
     ability = data.get("ability", "None")
-    evolves_from = data.get("evolves_from", None)
-    evolves_to = data.get("evolves_to", [])
-
-    lines = [
-        f"### {digimon_name}",
-        f"**Attribute**: {attribute}",
-        f"**Level**: {level}",
-        "",
-        f"**HP**: {hp_value}",
-        f"**Strength**: {strength_str}",
-        f"**Dexterity**: {dex_str}",
-        f"**Vitality**: {vit_str}",
-        f"**Special**: {spc_str}",
-        f"**Insight**: {ins_str}",
-    ]
-
-    if ability:
-        lines.append(f"**Ability**: {ability}")
-
-    return "\n".join(lines)
+    ability_suffix = f"\n**Ability**: {ability}" if ability else ""
+
+    return (
+        f"### {digimon_name}\n"
+        f"**Attribute**: {attribute}\n"
+        f"**Level**: {level}\n"
+        f"\n"
+        f"**HP**: {hp_value}\n"
+        f"**Strength**: {strength_str}\n"
+        f"**Dexterity**: {dex_str}\n"
+        f"**Vitality**: {vit_str}\n"
+        f"**Special**: {spc_str}\n"
+        f"**Insight**: {ins_str}"
+        f"{ability_suffix}"
+    )
 
 
 class DigimonView(ui.View):
@@ -105,17 +121,15 @@ class DigimonCog(commands.Cog):
     )
     @app_commands.describe(name="The name of the Digimon (e.g. Agumon)")
     async def get_digimon(self, interaction: discord.Interaction, name: str):
-        json_path = f"data/digimon/{name.lower()}.json"
-        if not os.path.exists(json_path):
+        try:
+            # Off-loop so a slow disk can't stall the whole bot.
+            data = await asyncio.to_thread(_digimon_store.load_digimon, name.lower())
+        except FileNotFoundError:
             await interaction.response.send_message(
                 f"Sorry, I couldn't find data for '{name}'.",
                 ephemeral=True
             )
             return
-
-        try:
-            with open(json_path, "r", encoding="utf-8") as f:
-                data = json.load(f)
         except json.JSONDecodeError:
             await interaction.response.send_message(
                 f"Error: The file for '{name}' is not valid JSON.",
@@ -133,17 +147,15 @@ class DigimonCog(commands.Cog):
         interaction: discord.Interaction,
         current: str
     ) -> list[app_commands.Choice[str]]:
-        if not os.path.isdir("data/digimon"):
+        try:
+            if not current:
+                return list(_digimon_store.get_empty_choices())
+            matched = _digimon_store.search_names(current)
+        except FileNotFoundError:
             return []
-
-        all_digimon = [
-            file[:-5] for file in os.listdir("data/digimon")
-            if file.lower().endswith(".json")
-        ]
-
-        matched = [dn for dn in all_digimon if current.lower() in dn.lower()][:25]
         return [app_commands.Choice(name=dm.capitalize(), value=dm) for dm in matched]
 
 
 async def setup(bot: commands.Bot):
+    _digimon_store.preload_all()
     await bot.add_cog(DigimonCog(bot))
@@ -1,9 +1,15 @@
 import discord
 from discord.ext import commands
 from discord import app_commands
+import asyncio
 import random
 import os
-import json
+from collections import Counter
+
+try:
+    import orjson as _json
+except ImportError:
+    import json as _json
 
 ROOM_DESCRIPTIONS = [
     "You enter a torch-lit stone chamber with ancient runes on the walls.",
@@ -23,25 +29,55 @@ DIRECTIONS = {
 DIRECTION_EMOJI = {v: k for k, v in DIRECTIONS.items()}
 STAIRS_EMOJI = "🏃‍♂️"  # Running man for stairs
 
-def get_room_image(dungeon_id, room_id):
-    for ext in ['jpg', 'png']:
-        img_path = f"dungeons/{dungeon_id}/{room_id}.{ext}"
-        if os.path.isfile(img_path):
-            return discord.File(img_path), os.path.basename(img_path)
-    return None, None
+# (floor, room_id) -> CDN url of the already-uploaded room image, so a
+# revisited room doesn't re-read the file or re-upload it to Discord.
+_ROOM_URL_CACHE: dict[tuple[int, str], str] = {}
+
+def get_room_image(img_path):
+    # discord.File objects are one-shot, so only the path is cached on the
+    # dungeon and the File is opened fresh per send.
+    return discord.File(img_path), os.path.basename(img_path)
 
 def load_dungeon_json(dungeon_id):
     path = f"dungeons/{dungeon_id}/rooms.json"
     if not os.path.isfile(path):
         return None
-    with open(path, "r", encoding="utf-8") as f:
-        return json.load(f)
-    return None
+    with open(path, "rb") as f:
+        data = _json.loads(f.read())
+    # Index rooms by coordinates once, so moving the party is a dict
+    # lookup instead of a scan over every room.
+    data["_coord_index"] = {
+        (room["x"], room["y"]): room_id
+        for room_id, room in data["rooms"].items()
+    }
+    # The emoji/direction mapping and its prompt text are static per
+    # room definition, so build them here instead of on every visit.
+    for room in data["rooms"].values():
+        room["_possible_dirs"] = {
+            DIRECTION_EMOJI[way]: way
+            for way in room["ways"] if way in DIRECTION_EMOJI
+        }
+        room["_dir_text"] = " ".join(room["_possible_dirs"])
+    data["_stairs_candidates"] = tuple(
+        room_id for room_id, room in data["rooms"].items() if room.get("room")
+    )
+    # Resolve room image paths once here, so image-less rooms don't cost
+    # two stat syscalls on every single visit.
+    room_images = {}
+    for room_id in data["rooms"]:
+        room_images[room_id] = None
+        for ext in ("jpg", "png"):
+            img_path = f"dungeons/{dungeon_id}/{room_id}.{ext}"
+            if os.path.isfile(img_path):
+                room_images[room_id] = img_path
+                break
+    data["_room_images"] = room_images
+    return data
 
 def pick_stairs_room(dungeon, exclude_room):
     room_candidates = [
-        room_id for room_id, room in dungeon["rooms"].items()
-        if room.get("room") and room_id != exclude_room
+        room_id for room_id in dungeon["_stairs_candidates"]
+        if room_id != exclude_room
     ]
     return random.choice(room_candidates) if room_candidates else None
 
@@ -88,8 +124,15 @@ class DungeonCrawl(commands.Cog):
             if player and player not in all_players:
                 all_players.append(player)
 
-        # Load first dungeon (floor 1)
-        dungeon = load_dungeon_json(1)
+        # Load every floor up front in parallel worker threads, so
+        # descending stairs later never waits on a mid-game disk read.
+        floor_numbers = range(1, floors + 1)
+        floor_data = await asyncio.gather(
+            *(asyncio.to_thread(load_dungeon_json, fl) for fl in floor_numbers)
+        )
+        preloaded = {fl: d for fl, d in zip(floor_numbers, floor_data) if d}
+
+        dungeon = preloaded.get(1)
         if not dungeon:
             await interaction.response.send_message("Could not load dungeon for floor 1.", ephemeral=True)
             return
@@ -97,15 +140,19 @@ class DungeonCrawl(commands.Cog):
         current_room_id = dungeon["startingRoom"]
         stairs_room_id = pick_stairs_room(dungeon, current_room_id)
 
+        player_ids = frozenset(m.id for m in all_players)
+
         crawl_state = {
             "players": all_players,
+            "player_ids": player_ids,
             "floors": floors,
             "difficulty": difficulty.value,
             "current_floor": 1,
             "current_dungeon": dungeon,
+            "preloaded_dungeons": preloaded,
             "current_room_id": current_room_id,
             "stairs_room_id": stairs_room_id,
-            "awaiting_activity": set(m.id for m in all_players),
+            "awaiting_activity": set(player_ids),
             "last_msg": None,
             "waiting_for_checkin": True,
             "waiting_for_reactions": False,
@@ -145,44 +192,55 @@ class DungeonCrawl(commands.Cog):
 
     async def describe_room(self, channel, state):
         state["votes"] = {}
-        state["pending_reactors"] = set(m.id for m in state["players"])
+        state["pending_reactors"] = set(state["player_ids"])
         state["waiting_for_reactions"] = True
 
         dungeon = state["current_dungeon"]
         room_id = state["current_room_id"]
         room = dungeon["rooms"][room_id]
 
-        # Use ways from dungeon file
-        ways = room["ways"]
-        possible_dirs = {DIRECTION_EMOJI[way]: way for way in ways if way in DIRECTION_EMOJI}
+        # Directions were precomputed from the room's ways at dungeon load
+        possible_dirs = room["_possible_dirs"]
+        dir_text = room["_dir_text"]
         is_stairs_room = (room_id == state["stairs_room_id"] and room.get("room", False))
         if is_stairs_room:
+            possible_dirs = dict(possible_dirs)
             possible_dirs[STAIRS_EMOJI] = "Stairs"
-
-        dir_text = ' '.join(possible_dirs.keys())
+            dir_text = " ".join(possible_dirs)
         desc = random.choice(ROOM_DESCRIPTIONS)
         if is_stairs_room:
             desc += f"\n\n**You see a staircase descending! React with {STAIRS_EMOJI} to go deeper.**"
 
-        file, img_filename = get_room_image(state["current_floor"], room_id)
+        cached_url = _ROOM_URL_CACHE.get((state["current_floor"], room_id))
+        file, img_filename = None, None
+        if not cached_url:
+            img_path = dungeon["_room_images"].get(room_id)
+            if img_path:
+                file, img_filename = await asyncio.to_thread(get_room_image, img_path)
         embed = discord.Embed(
             title=f"Room {room_id} (Floor {state['current_floor']})",
             description=desc,
             color=0xdaa520
         )
-        if img_filename:
+        if cached_url:
+            embed.set_image(url=cached_url)
+        elif img_filename:
             embed.set_image(url=f"attachment://{img_filename}")
 
-        msg = await channel.send(
-            f"Which way will the party go? React with {dir_text} below!\n"
-            f"**All party members must vote before the room continues!**",
-            embed=embed,
-            file=file
-        ) if file else await channel.send(
-            f"Which way will the party go? React with {dir_text} below!\n"
-            f"**All party members must vote before the room continues!**",
-            embed=embed
-        )
+        send_kwargs = {
+            "content": (
+                f"Which way will the party go? React with {dir_text} below!\n"
+                f"**All party members must vote before the room continues!**"
+            ),
+            "embed": embed,
+        }
+        if file:
+            send_kwargs["file"] = file
+        msg = await channel.send(**send_kwargs)
+        if file and msg.attachments:
+            # Remember the CDN url so revisits reuse the uploaded image
+            _ROOM_URL_CACHE[(state["current_floor"], room_id)] = msg.attachments[0].url
+
         for emoji in possible_dirs:
             await msg.add_reaction(emoji)
         state["vote_message_id"] = msg.id
@@ -196,7 +254,7 @@ class DungeonCrawl(commands.Cog):
             return
         if payload.message_id != state.get("vote_message_id"):
             return
-        if payload.user_id not in [m.id for m in state["players"]]:
+        if payload.user_id not in state["player_ids"]:
             return
         emoji = str(payload.emoji)
         if emoji not in state["current_possible_dirs"]:
@@ -214,11 +272,10 @@ class DungeonCrawl(commands.Cog):
         if not state:
             return
         channel = self.bot.get_channel(channel_id)
-        vote_counts = {emoji: 0 for emoji in state["current_possible_dirs"]}
-        for vote in state["votes"].values():
-            if vote in vote_counts:
-                vote_counts[vote] += 1
-        best_dirs = [k for k, v in vote_counts.items() if v == max(vote_counts.values()) and v > 0]
+        # Votes were already validated against possible_dirs on reaction add
+        vote_counts = Counter(state["votes"].values())
+        best = max(vote_counts.values(), default=0)
+        best_dirs = [k for k, v in vote_counts.items() if v == best and best > 0]
         if not best_dirs:
             await channel.send("No direction chosen! (Bug?)")
             return
@@ -235,7 +292,9 @@ class DungeonCrawl(commands.Cog):
                 return
             else:
                 state["current_floor"] += 1
-                dungeon = load_dungeon_json(state["current_floor"])
+                dungeon = state["preloaded_dungeons"].get(state["current_floor"])
+                if not dungeon:
+                    dungeon = await asyncio.to_thread(load_dungeon_json, state["current_floor"])
                 if not dungeon:
                     await channel.send(f"Could not load dungeon for floor {state['current_floor']}.")
                     self.active_crawls.pop(channel.id, None)
@@ -246,7 +305,7 @@ class DungeonCrawl(commands.Cog):
                 state["stairs_room_id"] = pick_stairs_room(dungeon, dungeon["startingRoom"])
                 await channel.send(f"Descending to floor {state['current_floor']}!")
                 await channel.send("Before the next room, everyone must check in again by sending a message!")
-                state["awaiting_activity"] = set(m.id for m in state["players"])
+                state["awaiting_activity"] = set(state["player_ids"])
                 state["waiting_for_checkin"] = True
                 return
 
@@ -264,11 +323,7 @@ class DungeonCrawl(commands.Cog):
         elif chosen_dir == "Right":
             x += 1
 
-        next_room_id = None
-        for rid, room in state["current_dungeon"]["rooms"].items():
-            if room["x"] == x and room["y"] == y:
-                next_room_id = rid
-                break
+        next_room_id = state["current_dungeon"]["_coord_index"].get((x, y))
 
         if not next_room_id:
             await channel.send("There is no room in that direction! The crawl ends here.")
@@ -278,7 +333,7 @@ class DungeonCrawl(commands.Cog):
         state["current_room_id"] = next_room_id
 
         await channel.send("Before the next room, everyone must check in again by sending a message!")
-        state["awaiting_activity"] = set(m.id for m in state["players"])
+        state["awaiting_activity"] = set(state["player_ids"])
         state["waiting_for_checkin"] = True
 
 async def setup(bot):
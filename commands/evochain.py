@@ -1,8 +1,9 @@
 import discord
 from discord.ext import commands
 from discord import app_commands
-import json
-import os
+import asyncio
+
+from commands import _digimon_store
 
 
 def build_dynamic_diagram(
@@ -26,8 +27,6 @@ def build_dynamic_diagram(
                      │          │
           pre_alt[3]──┘          └──evo_alt[3]
     """
-    import math
-
     # 1. Calculate the max name length for dynamic alignment
     all_names = pre_evo_main + pre_evo_alts + [current] + evo_main + evo_alts
     max_name_length = max(len(name) for name in all_names)
@@ -42,23 +41,32 @@ def build_dynamic_diagram(
         """Generate a vertical connector."""
         return " " * spaces + symbol
 
+    # Most Digimon have no alternate lines at all — for them the diagram
+    # is just the center row, so skip the section machinery entirely.
+    if not pre_evo_alts and not evo_alts:
+        pre_main_str = pad_name(pre_evo_main[0] if pre_evo_main else "", node_width)
+        current_str = pad_name(current, node_width)
+        evo_main_str = "═══".join(pad_name(evo, node_width) for evo in evo_main)
+        return f"```\n{pre_main_str}══╪══{current_str}══╪══{evo_main_str}\n```"
+
     # 3. Split alternate evolutions and pre-evolutions into halves
-    pre_evo_half = math.ceil(len(pre_evo_alts) / 2)
-    evo_half = math.ceil(len(evo_alts) / 2)
+    pre_evo_half = (len(pre_evo_alts) + 1) // 2
+    evo_half = (len(evo_alts) + 1) // 2
     pre_top, pre_bottom = pre_evo_alts[:pre_evo_half], pre_evo_alts[pre_evo_half:]
     evo_top, evo_bottom = evo_alts[:evo_half], evo_alts[evo_half:]
 
+    # The connector row between sections is the same every time — build it once
+    spine = f"{' ' * node_width}│{' ' * node_width}│"
+
     # 4. Build the top section
     top_section = []
     for i in range(max(len(pre_top), len(evo_top))):
         pre = f"{pad_name(pre_top[i], node_width)}──┐" if i < len(pre_top) else " " * (node_width + 3)
         evo = f"┌──{pad_name(evo_top[i], node_width)}" if i < len(evo_top) else ""
-        top_section.append(pre + evo)
+        top_section.append(f"{pre}{evo}")
 
     if pre_top or evo_top:
-        top_section.append(
-            (" " * (node_width)) + "│" + (" " * (node_width)) + "│"
-        )
+        top_section.append(spine)
 
     # 5. Build the center row
     pre_main_str = pad_name(pre_evo_main[0] if pre_evo_main else "", node_width)
@@ -71,13 +79,10 @@ def build_dynamic_diagram(
     for i in range(max(len(pre_bottom), len(evo_bottom))):
         pre = f"{pad_name(pre_bottom[i], node_width)}──┘" if i < len(pre_bottom) else " " * (node_width + 3)
         evo = f"└──{pad_name(evo_bottom[i], node_width)}" if i < len(evo_bottom) else ""
-        bottom_section.append(pre + evo)
+        bottom_section.append(f"{pre}{evo}")
 
     if pre_bottom or evo_bottom:
-        bottom_section.insert(
-            0,
-            (" " * (node_width)) + "│" + (" " * (node_width)) + "│"
-        )
+        bottom_section.insert(0, spine)
 
     # 7. Combine everything into the final diagram
     diagram = []
@@ -88,7 +93,7 @@ def build_dynamic_diagram(
         diagram.extend(bottom_section)
 
     # 8. Return the diagram wrapped in a code block
-    return "```\n" + "\n".join(diagram) + "\n```"
+    return "```\n{}\n```".format("\n".join(diagram))
 
 class DigievoCog(commands.Cog):
     """Cog for displaying Digimon evolution diagrams."""
@@ -99,16 +104,14 @@ class DigievoCog(commands.Cog):
     @app_commands.command(name="digievo", description="Show the Digimon's evo lines.")
     @app_commands.describe(name="The Digimon name (autocomplete).")
     async def get_digimon_evo(self, interaction: discord.Interaction, name: str):
-        file_path = f"data/digimon/{name.lower()}.json"
-        if not os.path.exists(file_path):
+        try:
+            data = await asyncio.to_thread(_digimon_store.load_digimon, name.lower())
+        except FileNotFoundError:
             await interaction.response.send_message(
                 f"Sorry, no data for '{name}'.", ephemeral=True
             )
             return
 
-        with open(file_path, "r", encoding="utf-8") as f:
-            data = json.load(f)
-
         # Extract evolution data
         pre_evo_main = data.get("evolve_from", {}).get("main_line", [])
         pre_evo_alts = data.get("evolve_from", {}).get("alternate_lines", [])
@@ -122,13 +125,15 @@ class DigievoCog(commands.Cog):
 
     @get_digimon_evo.autocomplete("name")
     async def digimon_name_autocomplete(self, interaction: discord.Interaction, current: str):
-        if not os.path.isdir("data/digimon"):
+        try:
+            if not current:
+                return list(_digimon_store.get_empty_choices())
+            matched = _digimon_store.search_names(current)
+        except FileNotFoundError:
             return []
-        all_files = os.listdir("data/digimon")
-        json_files = [f[:-5] for f in all_files if f.lower().endswith(".json")]
-        matched = [dn for dn in json_files if current.lower() in dn.lower()][:25]
         return [app_commands.Choice(name=m.capitalize(), value=m) for m in matched]
 
 
 async def setup(bot: commands.Bot):
+    _digimon_store.preload_all()
     await bot.add_cog(DigievoCog(bot))
@@ -1,11 +1,56 @@
+import bisect
 import discord
+from dataclasses import dataclass, field
 from discord.ext import commands
 import random
 
+def _drop_index_from_mask(mask: int, idx: int) -> int:
+    """Removes bit `idx` from a slot bitmask, shifting higher bits down."""
+    low = mask & ((1 << idx) - 1)
+    high = (mask >> (idx + 1)) << idx
+    return low | high
+
+
+@dataclass(slots=True)
+class CombatState:
+    """
+    State for one channel's combat. Characters are stored
+    struct-of-arrays style: one slot per character across the parallel
+    lists, plus `order`, a permutation of slot indices holding the
+    actual initiative order. slots=True gives fixed-offset attribute
+    access and drops the per-instance dict.
+    """
+    # one entry per character slot:
+    names: list[str] = field(default_factory=list)
+    dex: list[int] = field(default_factory=list)
+    roll: list[int] = field(default_factory=list)
+    prio_next: list = field(default_factory=list)  # dex override for next round, or None
+    # slot bookkeeping:
+    name_to_idx: dict[str, int] = field(default_factory=dict)
+    order: list[int] = field(default_factory=list)  # slot indices in initiative order
+    current_turn: int = 0
+    round: int = 1
+    # bitmasks over slot indices — membership is a single int &
+    react_mask: int = 0   # slots acting last next round
+    stall_mask: int = 0   # slots that stalled this round
+    # (lowercased name, Choice) pairs kept in sync on join/remove,
+    # so autocomplete doesn't rebuild Choice objects per keystroke
+    autocomplete_cache: list = field(default_factory=list)
+
+    def order_key(self):
+        dex, roll = self.dex, self.roll
+        return lambda i: (-dex[i], -roll[i])
+
+
 class InitiativeTracker(commands.Cog):
     def __init__(self, bot):
         self.bot = bot
-        self.combat_channels = {}
+        self.combat_channels: dict[int, CombatState] = {}
+        # Own RNG instance with its bound method cached — skips the
+        # module-level singleton lookup per roll and lets tests seed
+        # this Cog deterministically
+        self._rng = random.Random()
+        self._rng_randint = self._rng.randint
 
     @commands.hybrid_command(name="combat_start")
     async def combat_start(self, ctx):
@@ -14,29 +59,21 @@ class InitiativeTracker(commands.Cog):
             await ctx.send("Initiative tracking is already active in this channel!")
             return
 
-        self.combat_channels[ctx.channel.id] = {
-            "initiatives": [],
-            "current_turn": 0,
-            "round": 1,
-            "buffs": {},  
-            "statuses": {},  
-            "prio": {},    
-            "react": set(),  
-            "stall": set()   
-        }
+        self.combat_channels[ctx.channel.id] = CombatState()
         await ctx.send("Combat has started! Use /initiative to join initiative.")
 
     async def initiative_autocomplete(self, interaction: discord.Interaction, current: str):
         """Autocomplete for initiative participant names."""
-        channel_id = interaction.channel.id
-        if channel_id not in self.combat_channels:
+        combat = self.combat_channels.get(interaction.channel.id)
+        if combat is None:
             return []
-        
+
+        cur = current.lower()
         return [
-            discord.app_commands.Choice(name=char["name"], value=char["name"])
-            for char in self.combat_channels[channel_id]["initiatives"]
-            if current.lower() in char["name"].lower()
-        ]
+            choice
+            for lname, choice in combat.autocomplete_cache
+            if cur in lname
+        ][:25]
 
     @commands.hybrid_command(name="initiative")
     async def initiative(self, ctx, name: str, dexterity: int):
@@ -46,22 +83,30 @@ class InitiativeTracker(commands.Cog):
             return
 
         combat = self.combat_channels[ctx.channel.id]
-        combat["buffs"][name] = 0  
-        combat["statuses"][name] = None  
-
-        final_dex = dexterity + combat["buffs"].get(name, 0)
-        if combat["statuses"].get(name) == "Paralysis":
-            final_dex //= 2
-
-        d100_roll = random.randint(1, 100)  # d100 for tiebreaker
-        combat["initiatives"].append({
-            "name": name,
-            "dexterity": final_dex,
-            "roll": d100_roll
-        })
-
-        # Sort by dexterity first, then d100 for tiebreakers
-        combat["initiatives"].sort(key=lambda x: (-x["dexterity"], -x["roll"]))
+
+        d100_roll = self._rng_randint(1, 100)  # d100 for tiebreaker
+
+        idx = combat.name_to_idx.get(name)
+        if idx is None:
+            idx = len(combat.names)
+            combat.names.append(name)
+            combat.dex.append(dexterity)
+            combat.roll.append(d100_roll)
+            combat.prio_next.append(None)
+            combat.name_to_idx[name] = idx
+            combat.autocomplete_cache.append(
+                (name.lower(), discord.app_commands.Choice(name=name, value=name))
+            )
+        else:
+            # Re-joining updates the existing slot and re-seats it
+            combat.roll[idx] = d100_roll
+            combat.order.remove(idx)
+
+        combat.dex[idx] = dexterity
+
+        # Insert in order (dexterity first, then d100 for tiebreakers)
+        # instead of re-sorting the whole list on every join.
+        bisect.insort(combat.order, idx, key=combat.order_key())
         await ctx.send(f"{name} has joined the initiative with Dexterity {dexterity} and a tiebreaker roll of {d100_roll}!")
 
     @commands.hybrid_command(name="initiative_remove")
@@ -73,7 +118,26 @@ class InitiativeTracker(commands.Cog):
             return
 
         combat = self.combat_channels[ctx.channel.id]
-        combat["initiatives"] = [char for char in combat["initiatives"] if char["name"] != name]
+        idx = combat.name_to_idx.pop(name, None)
+        if idx is not None:
+            for slots in (combat.names, combat.dex, combat.roll,
+                          combat.prio_next):
+                del slots[idx]
+            # Slots above the removed one shift down by one
+            combat.order = [i - 1 if i > idx else i for i in combat.order if i != idx]
+            for other, i in combat.name_to_idx.items():
+                if i > idx:
+                    combat.name_to_idx[other] = i - 1
+            combat.react_mask = _drop_index_from_mask(combat.react_mask, idx)
+            combat.stall_mask = _drop_index_from_mask(combat.stall_mask, idx)
+
+            lname = name.lower()
+            cache = combat.autocomplete_cache
+            for i, entry in enumerate(cache):
+                if entry[0] == lname:
+                    del cache[i]
+                    break
+
         await ctx.send(f"{name} has been removed from the initiative order.")
 
     @commands.hybrid_command(name="initiative_start")
@@ -84,7 +148,7 @@ class InitiativeTracker(commands.Cog):
             return
 
         combat = self.combat_channels[ctx.channel.id]
-        if not combat["initiatives"]:
+        if not combat.order:
             await ctx.send("No players are in the initiative order.")
             return
 
@@ -93,43 +157,59 @@ class InitiativeTracker(commands.Cog):
     async def update_initiative_order(self, ctx, first_round=False):
         """Updates initiative order at the start of each round."""
         combat = self.combat_channels[ctx.channel.id]
+        dex = combat.dex
 
-        # Apply Prio, React, and reset after the round
-        for char in combat["initiatives"]:
-            name = char["name"]
-            if name in combat["prio"]:
-                char["dexterity"] = combat["prio"][name]
-            if name in combat["react"]:
-                char["dexterity"] = -1  
+        # With no prio/react/stall this round the order is already
+        # sorted (joins insert in place), so skip the whole re-sort.
+        prio_next = combat.prio_next
+        if (combat.react_mask or combat.stall_mask
+                or any(value is not None for value in prio_next)):
+            # Apply Prio, React, and reset after the round — one forward
+            # pass over the contiguous slot lists
+            for i, value in enumerate(prio_next):
+                if value is not None:
+                    dex[i] = value
+                    prio_next[i] = None
+            mask = combat.react_mask
+            while mask:
+                i = (mask & -mask).bit_length() - 1  # lowest set bit
+                dex[i] = -1
+                mask &= mask - 1
+            combat.react_mask = 0
+            combat.stall_mask = 0
 
-        combat["initiatives"].sort(key=lambda x: (-x["dexterity"], -x["roll"]))
+            combat.order.sort(key=combat.order_key())
 
-        combat["prio"].clear()
-        combat["react"].clear()
+        names = combat.names
+        parts = [f"### Round {combat.round} Begins! ###\n"]
+        parts.extend(
+            f"{pos}. {names[i]} (**{dex[i]}**)\n"
+            for pos, i in enumerate(combat.order, start=1)
+        )
 
-        initiative_message = f"### Round {combat['round']} Begins! ###\n"
-        for i, char in enumerate(combat["initiatives"], start=1):
-            initiative_message += f"{i}. {char['name']} (**{char['dexterity']}**)\n"
-
-        await ctx.send(initiative_message)
-        await self.announce_turn(ctx)
+        # Fold the turn announcement into the same message — one REST
+        # round-trip to Discord instead of two per round transition
+        current = names[combat.order[combat.current_turn]]
+        parts.append(f"\nIt is now **{current}'s** turn! {ctx.author.mention}")
+        await ctx.send("".join(parts))
 
     async def announce_turn(self, ctx):
         """Announces the current turn."""
         combat = self.combat_channels[ctx.channel.id]
-        current_character = combat["initiatives"][combat["current_turn"]]
-        await ctx.send(f"It is now **{current_character['name']}'s** turn! {ctx.author.mention}")
+        idx = combat.order[combat.current_turn]
+        await ctx.send(f"It is now **{combat.names[idx]}'s** turn! {ctx.author.mention}")
 
     @commands.hybrid_command(name="next")
     async def next(self, ctx):
         """Ends the current turn."""
         combat = self.combat_channels[ctx.channel.id]
-        combat["current_turn"] += 1
+        combat.current_turn += 1
 
-        if combat["current_turn"] >= len(combat["initiatives"]):
-            combat["current_turn"] = 0
-            combat["round"] += 1
-            combat["stall"].clear()
+        if combat.current_turn >= len(combat.order):
+            combat.current_turn = 0
+            combat.round += 1
+            # stall_mask is reset in update_initiative_order, which needs
+            # it to know the order was permuted this round
             await self.update_initiative_order(ctx)
 
         else:
@@ -147,7 +227,11 @@ class InitiativeTracker(commands.Cog):
     async def prio(self, ctx, name: str, value: int):
         """Sets initiative to Y for next round only."""
         combat = self.combat_channels[ctx.channel.id]
-        combat["prio"][name] = value
+        idx = combat.name_to_idx.get(name)
+        if idx is None:
+            await ctx.send(f"{name} is not in the initiative order.")
+            return
+        combat.prio_next[idx] = value
         await ctx.send(f"{name}'s initiative is set to {value} for the next round.")
 
     @commands.hybrid_command(name="react")
@@ -155,19 +239,24 @@ class InitiativeTracker(commands.Cog):
     async def react(self, ctx, name: str):
         """Sets initiative to lowest priority (last) for next round only."""
         combat = self.combat_channels[ctx.channel.id]
-        combat["react"].add(name)
+        idx = combat.name_to_idx.get(name)
+        if idx is None:
+            await ctx.send(f"{name} is not in the initiative order.")
+            return
+        combat.react_mask |= 1 << idx
         await ctx.send(f"{name} will act last in the next round.")
 
     @commands.hybrid_command(name="stall")
     async def stall(self, ctx):
         """Moves the current player to the end of the initiative order for this round only."""
         combat = self.combat_channels[ctx.channel.id]
-        current_character = combat["initiatives"][combat["current_turn"]]["name"]
+        order = combat.order
+        idx = order.pop(combat.current_turn)
 
-        combat["stall"].add(current_character)
-        combat["initiatives"].append(combat["initiatives"].pop(combat["current_turn"]))
+        combat.stall_mask |= 1 << idx
+        order.append(idx)
 
-        await ctx.send(f"{current_character} is stalling and will act last this round.")
+        await ctx.send(f"{combat.names[idx]} is stalling and will act last this round.")
         await self.announce_turn(ctx)
 
 async def setup(bot):
@@ -2,10 +2,16 @@ import discord
 from discord.ext import commands
 import os
 import asyncio
+import pathlib
 
 def get_token() -> str:
-    with open("token.txt", "r") as f:
-        return f.read().strip()
+    # read_text skips the buffered-reader setup of open() — startup only,
+    # but it matters on restart-heavy deployments
+    return pathlib.Path("token.txt").read_text().strip()
+
+# When set, commands are synced to this guild only, which shows up
+# immediately instead of waiting on Discord's global propagation.
+GUILD_ID = os.environ.get("GUILD_ID")
 
 intents = discord.Intents.default()
 
@@ -14,23 +20,40 @@ bot = commands.Bot(command_prefix="", intents=intents)
 
 @bot.event
 async def on_ready():
-    await bot.tree.sync()  # Sync slash commands so they appear in Discord
+    # on_ready also fires on reconnects — only sync once per session
+    if not getattr(bot, "synced", False):
+        if GUILD_ID:
+            guild = discord.Object(id=int(GUILD_ID))
+            bot.tree.copy_global_to(guild=guild)
+            await bot.tree.sync(guild=guild)
+        else:
+            await bot.tree.sync()  # Sync slash commands so they appear in Discord
+        bot.synced = True
     print(f"Bot is online as {bot.user}")
 
 async def load_extensions():
-    # Same structure, but with try-except
-    for filename in os.listdir("./commands"):
-        if filename.endswith(".py") and not filename.startswith("__"):
-            extension = filename[:-3]  # strip ".py"
-            try:
-                await bot.load_extension(f"commands.{extension}")
-                print(f"Loaded extension: {extension}")
-            except commands.errors.NoEntryPointError:
-                # This file doesn't have `setup` or `async def setup(bot)`, so skip it.
-                print(f"Skipped non-Cog file: {extension}")
-            except commands.ExtensionFailed as e:
-                # Some other error inside the extension code
-                print(f"Failed to load extension {extension}: {e}")
+    # Load all extensions concurrently so startup is bounded by the
+    # slowest one instead of the sum of them all.
+    extensions = [
+        filename[:-3]  # strip ".py"
+        for filename in os.listdir("./commands")
+        if filename.endswith(".py") and not filename.startswith("__")
+    ]
+    results = await asyncio.gather(
+        *(bot.load_extension(f"commands.{extension}") for extension in extensions),
+        return_exceptions=True
+    )
+    for extension, result in zip(extensions, results):
+        if isinstance(result, commands.errors.NoEntryPointError):
+            # This file doesn't have `setup` or `async def setup(bot)`, so skip it.
+            print(f"Skipped non-Cog file: {extension}")
+        elif isinstance(result, commands.ExtensionFailed):
+            # Some other error inside the extension code
+            print(f"Failed to load extension {extension}: {result}")
+        elif isinstance(result, BaseException):
+            raise result
+        else:
+            print(f"Loaded extension: {extension}")
 
 async def main():
     await load_extensions()
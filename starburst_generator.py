@@ -15,7 +15,9 @@ Features:
 - Optional save-to-file
 """
 
-from typing import List, Optional
+import functools
+import sys
+from typing import Iterator, List, Optional
 
 
 def starburst(n_per_side: int,
@@ -41,6 +43,39 @@ def starburst(n_per_side: int,
         gap = len(middle_line) - len(left_part) - len(right_part)
     ensuring exact symmetry per line.
     """
+    # The build is a pure function of its arguments, so freeze the label
+    # lists to tuples and let the memoized worker serve repeats.
+    left = tuple(left_labels) if left_labels is not None else None
+    right = tuple(right_labels) if right_labels is not None else None
+    return "\n".join(_starburst_lines(n_per_side, center_label, left, right,
+                                      mid_dash_len, first_dash_len, dash_step))
+
+
+def starburst_iter(n_per_side: int,
+                   center_label: str = "Center",
+                   left_labels: Optional[List[str]] = None,
+                   right_labels: Optional[List[str]] = None,
+                   mid_dash_len: int = 13,
+                   first_dash_len: int = 3,
+                   dash_step: int = 2) -> Iterator[str]:
+    """
+    Like starburst(), but yields the diagram line by line so callers can
+    stream it to a file or stdout without holding the joined string.
+    """
+    left = tuple(left_labels) if left_labels is not None else None
+    right = tuple(right_labels) if right_labels is not None else None
+    return iter(_starburst_lines(n_per_side, center_label, left, right,
+                                 mid_dash_len, first_dash_len, dash_step))
+
+
+@functools.lru_cache(maxsize=128)
+def _starburst_lines(n_per_side: int,
+                     center_label: str,
+                     left_labels: Optional[tuple],
+                     right_labels: Optional[tuple],
+                     mid_dash_len: int,
+                     first_dash_len: int,
+                     dash_step: int) -> tuple:
     if n_per_side < 1 or n_per_side % 2 == 0:
         raise ValueError("n_per_side must be an odd integer >= 1, e.g. 3, 5, 7.")
 
@@ -53,30 +88,35 @@ def starburst(n_per_side: int,
     if len(left_labels) != n_per_side or len(right_labels) != n_per_side:
         raise ValueError("left_labels and right_labels must each have length n_per_side.")
 
-    def L(i): return f"[{left_labels[i-1]}]"
-    def R(i): return f"[{right_labels[i-1]}]"
+    # Bracketed labels, rendered once — indexing a list per row is a
+    # single bytecode versus a nested-function call per label
+    L_arr = [f"[{lbl}]" for lbl in left_labels]
+    R_arr = [f"[{lbl}]" for lbl in right_labels]
     center = f"[{center_label}]"
 
     mid = (n_per_side + 1) // 2  # which index is the straight spine
 
     # Build the middle line (defines target total width for all rows)
-    mid_left = f"{L(mid)} {'-'*mid_dash_len}"
-    mid_right = f"{'-'*mid_dash_len} {R(mid)}"
+    mid_dash_str = '-' * mid_dash_len
+    mid_left = f"{L_arr[mid - 1]} {mid_dash_str}"
+    mid_right = f"{mid_dash_str} {R_arr[mid - 1]}"
     middle_line = f"{mid_left} {center} {mid_right}"
     target_width = len(middle_line)
 
-    # Dash lengths for angled rows: grow towards the middle (outer -> inner)
-    # For example with first=3, step=2 and mid=3 (N=5): [3, 5]
-    dash_seq = [first_dash_len + dash_step * i for i in range(0, mid - 1)]
+    # Dash strings for angled rows: lengths grow towards the middle
+    # (outer -> inner) in an arithmetic progression, e.g. with first=3,
+    # step=2 and mid=3 (N=5): ['---', '-----']. Each is used twice
+    # (upper + mirrored lower row), so build them once here.
+    dash_strs = ['-' * (first_dash_len + dash_step * i) for i in range(mid - 1)]
 
     lines = []
 
     # Upper angled lines (top to just above middle)
     # i goes 1..mid-1 (top to just above center); dash_len increases inward
     for i in range(1, mid):
-        dash_len = dash_seq[i - 1]
-        left_part = f"{L(i)} {'-'*dash_len}\\"
-        right_part = f"/{'-'*dash_len} {R(i)}"
+        dashes = dash_strs[i - 1]
+        left_part = f"{L_arr[i - 1]} {dashes}\\"
+        right_part = f"/{dashes} {R_arr[i - 1]}"
         gap = max(1, target_width - len(left_part) - len(right_part))
         lines.append(left_part + (" " * gap) + right_part)
 
@@ -86,18 +126,17 @@ def starburst(n_per_side: int,
     # Lower angled lines (just below middle to bottom)
     # Mirror the dash lengths outward again: inner -> outer (reverse of upper)
     for j, i in enumerate(range(mid + 1, n_per_side + 1), start=1):
-        dash_len = dash_seq[-j]  # mirror
-        left_part = f"{L(i)} {'-'*dash_len}/"
-        right_part = f"\\{'-'*dash_len} {R(i)}"
+        dashes = dash_strs[-j]  # mirror
+        left_part = f"{L_arr[i - 1]} {dashes}/"
+        right_part = f"\\{dashes} {R_arr[i - 1]}"
         gap = max(1, target_width - len(left_part) - len(right_part))
         lines.append(left_part + (" " * gap) + right_part)
 
-    return "\n".join(lines)
+    return tuple(lines)
 
 
 def main():
-    print("ASCII Starburst Generator")
-    print("=========================")
+    print("ASCII Starburst Generator\n=========================")
     try:
         n = int(input("Enter an odd number of branches per side (e.g., 3, 5, 7): ").strip())
         center = input("Center label [default: Center]: ").strip() or "Center"
@@ -121,7 +160,7 @@ def main():
         dash_step = input("Dash growth step (toward center) [default: 2]: ").strip()
         dash_step = int(dash_step) if dash_step else 2
 
-        diagram = starburst(
+        diagram_args = dict(
             n_per_side=n,
             center_label=center,
             left_labels=left_labels,
@@ -131,14 +170,18 @@ def main():
             dash_step=dash_step
         )
 
-        print("\nGenerated Starburst:\n")
-        print(diagram)
+        # One buffered writelines instead of a print per chunk — the
+        # repeated renders below are served from the memoized build
+        sys.stdout.write("\nGenerated Starburst:\n\n")
+        sys.stdout.writelines(line + "\n" for line in starburst_iter(**diagram_args))
+        sys.stdout.flush()
 
         save = input("\nSave to file? (y/n): ").strip().lower()
         if save == "y":
             path = input("Filename (e.g., starburst.txt): ").strip() or "starburst.txt"
             with open(path, "w", encoding="utf-8") as f:
-                f.write(diagram + "\n")
+                # Stream line by line instead of writing a joined copy
+                f.writelines(line + "\n" for line in starburst_iter(**diagram_args))
             print(f"Saved to {path}")
 
     except ValueError as e:
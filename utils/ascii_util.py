@@ -1,3 +1,10 @@
+# Connector fragments shared by every label row
+TOP_R_PREFIX = "┌── "
+BOT_R_PREFIX = "└── "
+TOP_L_SUFFIX = "──┐"
+BOT_L_SUFFIX = "──┘"
+
+
 def build_fancy_diagram(
     left_side: list[str],
     main_pre_evo: str,
@@ -47,33 +54,35 @@ def build_fancy_diagram(
     gap_between = 14   # horizontal gap between left portion and right portion
     center_line_spacing = 2  # minimal spacing around the center line parts
 
+    # Padding strings are the same on every row — build them once
+    GAP = " " * gap_between
+    INDENT = " " * indent_left
+    LEFT_PAD = " " * (indent_left + 12)
+
     # We'll define a small helper for building a line with left text + right text
     def build_line(left_text: str, right_text: str) -> str:
         # The left_text is placed directly, the right_text is placed gap_between spaces away
-        gap = " " * gap_between
-        return left_text + gap + right_text
+        return left_text + GAP + right_text
 
     # ─────────────────────────────────────────────────────────────────────────────
     # 3) Print the TOP half (above the center line)
 
+    # Render every label row up front — one comprehension instead of an
+    # f-string build per loop iteration
+    left_top_rendered = [f"{INDENT}{name:<10}{TOP_L_SUFFIX}" for name in left_top]
+    right_top_rendered = [TOP_R_PREFIX + name for name in right_top]
+    left_bottom_rendered = [f"{INDENT}{name:<10}{BOT_L_SUFFIX}" for name in left_bottom]
+    right_bottom_rendered = [BOT_R_PREFIX + name for name in right_bottom]
+
     # We'll iterate row by row up to max(top_left_count, top_right_count)
     top_count = max(top_left_count, top_right_count)
 
     for i in range(top_count):
-        # LHS
-        if i < len(left_top):
-            # E.g. "      SideLine ──┐"
-            left_str = f"{' ' * indent_left}{left_top[i]:<10}──┐"
-        else:
-            # No line here, just blank with enough spacing
-            left_str = " " * (indent_left + 12)
+        # LHS: e.g. "      SideLine ──┐", or blank with enough spacing
+        left_str = left_top_rendered[i] if i < len(left_top) else LEFT_PAD
 
-        # RHS
-        if i < len(right_top):
-            # E.g. "┌── SideLine"
-            right_str = f"┌── {right_top[i]}"
-        else:
-            right_str = ""
+        # RHS: e.g. "┌── SideLine"
+        right_str = right_top_rendered[i] if i < len(right_top) else ""
 
         # Combine
         line = build_line(left_str, right_str)
@@ -82,12 +91,12 @@ def build_fancy_diagram(
         # Next line for vertical connectors (unless it's the last row)
         if i < top_count - 1:
             # We still have more top lines
-            left_conn = " " * (indent_left + 12) + "│"
+            left_conn = LEFT_PAD + "│"
             right_conn = "│" if (i < len(right_top)) else ""
             lines.append(build_line(left_conn, right_conn))
         else:
             # The last top line: connect down to center row
-            left_conn = " " * (indent_left + 12) + "│"
+            left_conn = LEFT_PAD + "│"
             right_conn = "│" if (i < len(right_top)) else ""
             lines.append(build_line(left_conn, right_conn))
 
@@ -105,19 +114,20 @@ def build_fancy_diagram(
     ]
     center_line = " ".join(center_parts)
     # Indent it so it lines under the "│" from the left side. That means we do at least `indent_left` spaces.
-    center_line = " " * indent_left + center_line
+    center_line = INDENT + center_line
     lines.append(center_line)
 
     # ─────────────────────────────────────────────────────────────────────────────
     # 5) The connector line under the center (only if there are bottom lines)
     if bottom_left_count > 0 or bottom_right_count > 0:
-        # We want a line with "   │   │" under the '╪' or so. We can do a small trick:
-        # We'll find indices of '╪' in the center_line and put '│' under them.
-        center_chars = list(center_line)
-        indices = [i for i, ch in enumerate(center_chars) if ch == '╪']
+        # We want a line with "   │   │" under the '╪' or so. str.find is a
+        # C-level scan, so locating the few '╪' glyphs that way beats
+        # enumerating the whole line character by character.
         connector = [" "] * len(center_line)
-        for ix in indices:
-            connector[ix] = "│"
+        pos = center_line.find('╪')
+        while pos != -1:
+            connector[pos] = "│"
+            pos = center_line.find('╪', pos + 1)
         lines.append("".join(connector))
 
     # ─────────────────────────────────────────────────────────────────────────────
@@ -125,25 +135,18 @@ def build_fancy_diagram(
     bottom_count = max(bottom_left_count, bottom_right_count)
 
     for i in range(bottom_count):
-        # LHS
-        if i < len(left_bottom):
-            # e.g. "  SideLine ──┘"
-            left_str = f"{' ' * indent_left}{left_bottom[i]:<10}──┘"
-        else:
-            left_str = " " * (indent_left + 12)
+        # LHS: e.g. "  SideLine ──┘"
+        left_str = left_bottom_rendered[i] if i < len(left_bottom) else LEFT_PAD
 
         # RHS
-        if i < len(right_bottom):
-            right_str = f"└── {right_bottom[i]}"
-        else:
-            right_str = ""
+        right_str = right_bottom_rendered[i] if i < len(right_bottom) else ""
 
         line = build_line(left_str, right_str)
         lines.append(line)
 
         # Another line for vertical connectors (unless it's the last row)
         if i < bottom_count - 1:
-            left_conn = " " * (indent_left + 12) + "│"
+            left_conn = LEFT_PAD + "│"
             right_conn = "│" if (i < len(right_bottom)) else ""
             lines.append(build_line(left_conn, right_conn))
 